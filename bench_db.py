@@ -0,0 +1,136 @@
+#!/usr/bin/env python
+"""
+Concurrent read/write load test against a scratch SQLite database, run once
+with SQLite's stock settings (DB_PROFILE=default) and once with the tuned
+profile (WAL, synchronous, busy_timeout, cache and mmap size).
+
+Writer threads record check-ins (MoodEntry + daily rollup) and reactions;
+reader threads load feed pages and dashboard rollups. Each profile runs in
+its own interpreter so app.py picks up its DB_PROFILE at import.
+
+Usage: python bench_db.py [--seconds 5] [--writers 4] [--readers 8] [--profiles default,tuned]
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime
+
+def percentile(values, pct):
+    if not values:
+        return 0.0
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * pct / 100))]
+
+def run_worker(args):
+    # Runs inside the child interpreter; DATABASE_URL/DB_PROFILE are already set
+    from sqlalchemy.exc import OperationalError
+    from app import (app, db, User, MoodPost, MoodEntry, DailyMoodRollup,
+                     bump_daily_rollup, increment_reaction, feed_page)
+
+    with app.app_context():
+        users = [User(name=f'bench{i}', email=f'bench{i}@example.com', password_hash='x') for i in range(args.writers)]
+        db.session.add_all(users)
+        db.session.flush()
+        posts = [MoodPost(user_id=u.id, username=u.name, content='benchmark post', emotion='positive') for u in users]
+        db.session.add_all(posts)
+        db.session.commit()
+        user_ids = [u.id for u in users]
+        post_ids = [p.id for p in posts]
+
+    stop = time.monotonic() + args.seconds
+    lock = threading.Lock()
+    stats = {'write': [], 'read': [], 'errors': 0}
+
+    def record(kind, started):
+        with lock:
+            stats[kind].append(time.perf_counter() - started)
+
+    def writer(n):
+        uid, pid = user_ids[n % len(user_ids)], post_ids[n % len(post_ids)]
+        with app.app_context():
+            while time.monotonic() < stop:
+                started = time.perf_counter()
+                try:
+                    entry = MoodEntry(user_id=uid, mood='happy', note='load test')
+                    db.session.add(entry)
+                    bump_daily_rollup(uid, 'checkin', datetime.utcnow().date(), 'happy')
+                    increment_reaction(pid, '👍')
+                    db.session.commit()
+                    record('write', started)
+                except OperationalError:
+                    db.session.rollback()
+                    with lock:
+                        stats['errors'] += 1
+
+    def reader(n):
+        uid = user_ids[n % len(user_ids)]
+        with app.app_context():
+            while time.monotonic() < stop:
+                started = time.perf_counter()
+                try:
+                    feed_page()
+                    DailyMoodRollup.query.filter_by(user_id=uid).all()
+                    db.session.commit()
+                    record('read', started)
+                except OperationalError:
+                    db.session.rollback()
+                    with lock:
+                        stats['errors'] += 1
+
+    threads = [threading.Thread(target=writer, args=(i,)) for i in range(args.writers)]
+    threads += [threading.Thread(target=reader, args=(i,)) for i in range(args.readers)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    print(json.dumps({
+        kind: {
+            'ops': len(stats[kind]),
+            'per_second': len(stats[kind]) / args.seconds,
+            'p50_ms': percentile(stats[kind], 50) * 1000,
+            'p95_ms': percentile(stats[kind], 95) * 1000,
+        } for kind in ('write', 'read')
+    } | {'errors': stats['errors']}))
+
+def run_profile(profile, args):
+    here = os.path.dirname(os.path.abspath(__file__))
+    with tempfile.TemporaryDirectory() as tmp:
+        env = dict(os.environ, DB_PROFILE=profile, DATABASE_URL=f"sqlite:///{os.path.join(tmp, 'bench.db')}")
+        cmd = [sys.executable, os.path.abspath(__file__), '--worker', '--seconds', str(args.seconds),
+               '--writers', str(args.writers), '--readers', str(args.readers)]
+        out = subprocess.run(cmd, cwd=here, env=env, capture_output=True, text=True)
+        if out.returncode:
+            sys.stderr.write(out.stderr)
+            raise SystemExit(f"❌ {profile} run failed")
+        return json.loads(out.stdout.strip().splitlines()[-1])
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--seconds', type=float, default=5)
+    parser.add_argument('--writers', type=int, default=4)
+    parser.add_argument('--readers', type=int, default=8)
+    parser.add_argument('--profiles', default='default,tuned')
+    parser.add_argument('--worker', action='store_true', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        run_worker(args)
+        return
+
+    print(f"{args.writers} writers, {args.readers} readers, {args.seconds:g} s per profile")
+    for profile in args.profiles.split(','):
+        result = run_profile(profile, args)
+        w, r = result['write'], result['read']
+        print(f"{profile:>8}: writes {w['per_second']:8.1f}/s (p95 {w['p95_ms']:6.1f} ms)  "
+              f"reads {r['per_second']:8.1f}/s (p95 {r['p95_ms']:6.1f} ms)  "
+              f"locked errors {result['errors']}")
+
+if __name__ == '__main__':
+    main()
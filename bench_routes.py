@@ -0,0 +1,150 @@
+#!/usr/bin/env python
+"""
+Drive the hot routes (/dashboard, /mood, /messages/<id>, /coach, /journal,
+/profile/<id>) through the Flask test client as a sample of users from a
+generated database (see gen_data.py), recording latency percentiles and SQL
+statement counts per route.
+
+Save a run with --save and compare later runs against it with --baseline;
+the run fails when a route's p95 latency grows by more than --tolerance or
+it issues more SQL statements per request than before.
+
+Usage: python bench_routes.py [--database sqlite:///bench.db] [--requests 200] [--users 20]
+       python bench_routes.py --save baseline.json
+       python bench_routes.py --baseline baseline.json --tolerance 0.25
+"""
+import argparse
+import json
+import os
+import random
+import statistics
+import sys
+import time
+
+ROUTES = ['dashboard', 'mood', 'messages', 'coach', 'journal', 'profile']
+
+def percentile(values, pct):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * pct / 100))]
+
+def run(args):
+    from sqlalchemy import event
+    from app import app, db, User, Conversation
+
+    rng = random.Random(args.seed)
+    queries = [0]
+
+    with app.app_context():
+        @event.listens_for(db.engine, 'before_cursor_execute')
+        def count_query(*_):
+            queries[0] += 1
+
+        user_ids = [uid for (uid,) in db.session.query(User.id).filter(User.email.like('user%@example.com'))]
+        if not user_ids:
+            raise SystemExit("❌ No generated users found; run gen_data.py first")
+        sample = rng.sample(user_ids, min(args.users, len(user_ids)))
+        partners = dict(db.session.query(Conversation.user_id, Conversation.other_user_id).filter(
+            Conversation.user_id.in_(sample)).group_by(Conversation.user_id))
+        emails = dict(db.session.query(User.id, User.email).filter(User.id.in_(sample)))
+
+    clients = []
+    for uid in sample:
+        client = app.test_client()
+        response = client.post('/login', data={'email': emails[uid], 'password': 'password'})
+        if response.status_code >= 400:
+            raise SystemExit(f"❌ Login failed for user {uid}")
+        clients.append((uid, client))
+
+    def url(route, uid):
+        if route == 'messages':
+            return f"/messages/{partners[uid]}" if uid in partners else None
+        if route == 'profile':
+            return f"/profile/{uid}"
+        return '/' + route
+
+    results = {}
+    for route in args.routes:
+        latencies, counts, errors = [], [], 0
+        targets = [(client, url(route, uid)) for uid, client in clients if url(route, uid)]
+        if not targets:
+            print(f"  {route:<10} skipped (no users with data for it)")
+            continue
+        for client, path in targets[:args.warmup]:
+            client.get(path)
+        for i in range(args.requests):
+            client, path = targets[i % len(targets)]
+            before = queries[0]
+            started = time.perf_counter()
+            response = client.get(path)
+            latencies.append(time.perf_counter() - started)
+            counts.append(queries[0] - before)
+            errors += response.status_code != 200
+        results[route] = {
+            'requests': len(latencies),
+            'errors': errors,
+            'p50_ms': percentile(latencies, 50) * 1000,
+            'p95_ms': percentile(latencies, 95) * 1000,
+            'p99_ms': percentile(latencies, 99) * 1000,
+            'max_ms': max(latencies) * 1000,
+            'queries_avg': statistics.mean(counts),
+            'queries_max': max(counts),
+        }
+    return results
+
+def report(results):
+    print(f"{'route':<10} {'reqs':>6} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'max ms':>8} {'queries':>8} {'max q':>6} {'errors':>6}")
+    for route, r in results.items():
+        print(f"{route:<10} {r['requests']:>6} {r['p50_ms']:>8.1f} {r['p95_ms']:>8.1f} {r['p99_ms']:>8.1f} "
+              f"{r['max_ms']:>8.1f} {r['queries_avg']:>8.1f} {r['queries_max']:>6} {r['errors']:>6}")
+
+def compare(results, baseline, tolerance):
+    # Returns a list of regressions against a saved run
+    problems = []
+    for route, r in results.items():
+        base = baseline.get(route)
+        if not base:
+            continue
+        if r['p95_ms'] > base['p95_ms'] * (1 + tolerance):
+            problems.append(f"{route}: p95 {r['p95_ms']:.1f} ms vs {base['p95_ms']:.1f} ms")
+        if r['queries_avg'] > base['queries_avg'] + 0.5:
+            problems.append(f"{route}: {r['queries_avg']:.1f} queries/request vs {base['queries_avg']:.1f}")
+        if r['errors'] > base['errors']:
+            problems.append(f"{route}: {r['errors']} non-200 responses vs {base['errors']}")
+    return problems
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--database', help='SQLAlchemy URL (default: DATABASE_URL or sqlite:///bench.db)')
+    parser.add_argument('--routes', default=','.join(ROUTES), help='comma separated subset of ' + ','.join(ROUTES))
+    parser.add_argument('--requests', type=int, default=200, help='measured requests per route')
+    parser.add_argument('--warmup', type=int, default=5, help='unmeasured requests per route')
+    parser.add_argument('--users', type=int, default=20, help='distinct users to log in as')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--save', help='write results to this JSON file')
+    parser.add_argument('--baseline', help='compare against results saved by an earlier --save')
+    parser.add_argument('--tolerance', type=float, default=0.25, help='allowed p95 growth against the baseline')
+    args = parser.parse_args()
+    args.routes = [r for r in args.routes.split(',') if r]
+    unknown = set(args.routes) - set(ROUTES)
+    if unknown:
+        parser.error(f"unknown routes: {', '.join(sorted(unknown))}")
+
+    # app.py reads DATABASE_URL at import
+    os.environ['DATABASE_URL'] = args.database or os.environ.get('DATABASE_URL') or 'sqlite:///bench.db'
+    results = run(args)
+    report(results)
+    if args.save:
+        with open(args.save, 'w') as f:
+            json.dump(results, f, indent=2)
+    if args.baseline:
+        with open(args.baseline) as f:
+            problems = compare(results, json.load(f), args.tolerance)
+        for problem in problems:
+            print(f"❌ {problem}")
+        if problems:
+            return 1
+        print("✅ No regressions against the baseline")
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
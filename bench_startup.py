@@ -0,0 +1,54 @@
+#!/usr/bin/env python
+"""
+Measure cold-import time of app.py (what every worker boot, create_test_user.py
+and reset_db.py pay before doing any work). Imports run against a scratch
+database so instance/app.db is never migrated or touched.
+
+Usage: python bench_startup.py [--runs 10] [--max-seconds 1.5]
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+SNIPPET = (
+    "import time; t = time.perf_counter(); import app; "
+    "print(time.perf_counter() - t); "
+    "import sys; print('nltk' in sys.modules)"
+)
+
+def measure(runs):
+    here = os.path.dirname(os.path.abspath(__file__))
+    timings = []
+    nltk_loaded = False
+    with tempfile.TemporaryDirectory() as tmp:
+        # app.py reads DATABASE_URL at import; the unmeasured first import creates the schema
+        env = dict(os.environ, DATABASE_URL=f"sqlite:///{os.path.join(tmp, 'startup.db')}")
+        subprocess.run([sys.executable, '-c', 'import app'], cwd=here, env=env, capture_output=True, check=True)
+        for _ in range(runs):
+            out = subprocess.run([sys.executable, '-c', SNIPPET], cwd=here, env=env, capture_output=True, text=True,
+                                 check=True)
+            seconds, loaded = out.stdout.strip().splitlines()[-2:]
+            timings.append(float(seconds))
+            nltk_loaded = nltk_loaded or loaded == 'True'
+    return timings, nltk_loaded
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--runs', type=int, default=10)
+    parser.add_argument('--max-seconds', type=float, help='fail if the median import time exceeds this')
+    args = parser.parse_args()
+
+    timings, nltk_loaded = measure(args.runs)
+    median = statistics.median(timings)
+    print(f"import app: median {median*1000:.1f} ms, min {min(timings)*1000:.1f} ms, "
+          f"max {max(timings)*1000:.1f} ms over {args.runs} runs")
+    print(f"nltk imported at startup: {'yes' if nltk_loaded else 'no'}")
+    if args.max_seconds is not None and median > args.max_seconds:
+        print(f"❌ median import time above {args.max_seconds:.3f} s")
+        sys.exit(1)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,166 @@
+#!/usr/bin/env python
+"""
+Fill a database with synthetic FeelUP data for load testing: users, follows,
+mood posts with comments and reactions, messages, journal entries and
+check-ins, written with chunked bulk INSERTs. Derived tables (daily rollups,
+hourly mood stats, inbox summaries, user counters, search index) are then
+rebuilt with the app's own maintenance commands.
+
+Every user's password is "password". The same --seed gives the same data.
+
+Usage: python gen_data.py [--database sqlite:///bench.db] [--users 1000] [--checkins 50000] ...
+       python gen_data.py --users 100000 --posts 1000000 --checkins 10000000   # large
+"""
+import argparse
+import click
+import os
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+
+EMOTIONS = ['positive', 'neutral', 'negative']
+REACTIONS = ['😊', '❤️', '😢', '🙌']
+CHECKIN_MOODS = ['😊', 'calm', 'stressed', 'tired', 'happy', 'anxious', '😢', 'grateful']
+WORDS = ('today felt calm busy hopeful tired grateful stressed sunny walk coffee friends work family '
+         'sleep music rain beach run read quiet long short good hard better').split()
+
+def sentence(rng, n=8):
+    return ' '.join(rng.choice(WORDS) for _ in range(n)).capitalize() + '.'
+
+def chunked_insert(db, model, rows, chunk_size, label):
+    # rows is a generator; insert it chunk_size rows at a time
+    from sqlalchemy import insert
+    total, chunk, started = 0, [], time.perf_counter()
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) >= chunk_size:
+            db.session.execute(insert(model), chunk)
+            db.session.commit()
+            total += len(chunk)
+            chunk = []
+    if chunk:
+        db.session.execute(insert(model), chunk)
+        db.session.commit()
+        total += len(chunk)
+    print(f"  {label:<16} {total:>10,} rows in {time.perf_counter() - started:6.1f} s")
+    return total
+
+def next_id(db, model):
+    from sqlalchemy import func
+    return (db.session.query(func.max(model.id)).scalar() or 0) + 1
+
+def generate(args):
+    import app as feelup
+    from app import app, db, User, Follow, MoodPost, Comment, MoodReaction, Message, MoodJournal, MoodEntry
+    from werkzeug.security import generate_password_hash
+
+    rng = random.Random(args.seed)
+    now = datetime.utcnow().replace(microsecond=0)
+    span = args.days * 86400
+
+    def when():
+        return now - timedelta(seconds=rng.randrange(span))
+
+    with app.app_context():
+        print(f"Generating into {app.config['SQLALCHEMY_DATABASE_URI']}")
+        password_hash = generate_password_hash('password', method='pbkdf2:sha256:1')
+        first_user = next_id(db, User)
+        user_ids = range(first_user, first_user + args.users)
+        chunked_insert(db, User, ({
+            'id': uid, 'name': f'User {uid}', 'email': f'user{uid}@example.com',
+            'name_lower': f'user {uid}', 'email_lower': f'user{uid}@example.com',
+            'password_hash': password_hash, 'created_at': when(),
+        } for uid in user_ids), args.chunk_size, 'users')
+
+        def follows():
+            for uid in user_ids:
+                for other in set(rng.sample(user_ids, min(args.follows, len(user_ids)))) - {uid}:
+                    yield {'follower_id': uid, 'followed_id': other}
+        chunked_insert(db, Follow, follows(), args.chunk_size, 'follows')
+
+        first_post = next_id(db, MoodPost)
+        post_ids = range(first_post, first_post + args.posts)
+
+        def posts():
+            for pid in post_ids:
+                uid = rng.choice(user_ids)
+                yield {'id': pid, 'user_id': uid, 'username': f'User {uid}', 'content': sentence(rng),
+                       'emotion': rng.choice(EMOTIONS), 'anonymous': False, 'created_at': when()}
+        chunked_insert(db, MoodPost, posts(), args.chunk_size, 'mood posts')
+
+        def comments():
+            for pid in post_ids:
+                for _ in range(rng.randint(0, 2 * args.comments_per_post)):
+                    yield {'mood_id': pid, 'user': f'User {rng.choice(user_ids)}', 'text': sentence(rng, 5),
+                           'created_at': when()}
+        chunked_insert(db, Comment, comments(), args.chunk_size, 'comments')
+
+        def reactions():
+            for pid in post_ids:
+                for emoji in rng.sample(REACTIONS, rng.randint(0, len(REACTIONS))):
+                    yield {'mood_id': pid, 'emoji': emoji, 'count': rng.randint(1, 20)}
+        chunked_insert(db, MoodReaction, reactions(), args.chunk_size, 'reactions')
+
+        def messages():
+            # Each message goes to one of the sender's few regular partners
+            for _ in range(args.messages):
+                sender = rng.choice(user_ids)
+                partner = user_ids[(sender - first_user + rng.randint(1, args.partners)) % len(user_ids)]
+                if partner == sender:
+                    continue
+                yield {'sender_id': sender, 'receiver_id': partner, 'text': sentence(rng, 6), 'created_at': when()}
+        chunked_insert(db, Message, messages(), args.chunk_size, 'messages')
+
+        def journals():
+            for _ in range(args.journals):
+                created = when()
+                yield {'user_id': rng.choice(user_ids), 'date': created.date(), 'emotion': rng.choice(EMOTIONS),
+                       'text': sentence(rng, 20), 'sentiment_score': round(rng.uniform(-1, 1), 3),
+                       'score_pending': False, 'created_at': created}
+        chunked_insert(db, MoodJournal, journals(), args.chunk_size, 'journal entries')
+
+        def checkins():
+            for _ in range(args.checkins):
+                yield {'user_id': rng.choice(user_ids), 'mood': rng.choice(CHECKIN_MOODS), 'note': sentence(rng, 6),
+                       'score': round(rng.uniform(-1, 1), 3), 'score_pending': False, 'created_at': when()}
+        chunked_insert(db, MoodEntry, checkins(), args.chunk_size, 'check-ins')
+
+        print("Rebuilding derived tables")
+        steps = [('daily rollups', feelup.backfill_rollups), ('mood stats', feelup.backfill_mood_stats),
+                 ('conversations', feelup.backfill_conversations), ('user counters', feelup.reconcile_user_counters)]
+        if args.search and feelup.search_available():
+            steps.append(('search index', feelup.rebuild_search))
+        for label, command in steps:
+            started = time.perf_counter()
+            with click.Context(command) as ctx:
+                ctx.invoke(command)
+            print(f"  {label:<16} rebuilt in {time.perf_counter() - started:6.1f} s")
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--database', help='SQLAlchemy URL (default: DATABASE_URL or sqlite:///bench.db)')
+    parser.add_argument('--users', type=int, default=1000)
+    parser.add_argument('--follows', type=int, default=20, help='follows per user')
+    parser.add_argument('--posts', type=int, default=10000)
+    parser.add_argument('--comments-per-post', type=int, default=2, help='average')
+    parser.add_argument('--messages', type=int, default=50000)
+    parser.add_argument('--partners', type=int, default=5, help='conversation partners per user')
+    parser.add_argument('--journals', type=int, default=20000)
+    parser.add_argument('--checkins', type=int, default=50000)
+    parser.add_argument('--days', type=int, default=60, help='spread timestamps over this many days')
+    parser.add_argument('--chunk-size', type=int, default=5000)
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--no-search', dest='search', action='store_false', help='skip rebuilding the search index')
+    args = parser.parse_args()
+    if args.users < 2:
+        parser.error('--users must be at least 2')
+
+    # app.py reads DATABASE_URL at import
+    os.environ['DATABASE_URL'] = args.database or os.environ.get('DATABASE_URL') or 'sqlite:///bench.db'
+    started = time.perf_counter()
+    generate(args)
+    print(f"✅ Done in {time.perf_counter() - started:.1f} s")
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,116 @@
+// ===============================
+// Mood Charts
+// ===============================
+// Canvases opt in with data-chart="<name>" plus data-labels / data-values
+// (JSON). Keeping the drawing code here lets browsers cache it instead of
+// re-downloading it inline with every page.
+const moodCharts = {
+    journal: (labels, values) => ({
+        type: 'line',
+        data: {
+            labels: labels,
+            datasets: [{
+                label: 'Sentiment Score',
+                data: values,
+                borderColor: '#667eea',
+                backgroundColor: 'rgba(102, 126, 234, 0.12)',
+                fill: true,
+                tension: 0.36,
+                borderWidth: 3,
+                pointBackgroundColor: '#667eea',
+                pointBorderColor: '#fff',
+                pointBorderWidth: 2,
+                pointRadius: 5,
+                pointHoverRadius: 7
+            }]
+        },
+        options: {
+            responsive: true,
+            plugins: {
+                legend: { display: false },
+                tooltip: { backgroundColor: 'rgba(31,41,55,0.9)' }
+            },
+            scales: { y: { min: -1, max: 1 }, x: {} }
+        }
+    }),
+
+    weekly: (labels, values) => ({
+        type: 'line',
+        data: {
+            labels: labels,
+            datasets: [{
+                label: 'Avg Mood Score',
+                data: values,
+                borderColor: '#10b981',
+                backgroundColor: 'rgba(16,185,129,0.12)',
+                fill: true,
+                tension: 0.36,
+                borderWidth: 3,
+                pointRadius: 4
+            }]
+        },
+        options: { responsive: true, plugins: { legend: { display: false } }, scales: { y: { min: -1, max: 1 } } }
+    }),
+
+    // Bars colored by average mood
+    monthly: (labels, values) => ({
+        type: 'bar',
+        data: {
+            labels: labels,
+            datasets: [{
+                label: 'Avg Mood',
+                data: values,
+                backgroundColor: values.map(v => {
+                    if (v === 0) return 'rgba(209,213,219,0.6)';
+                    if (v >= 0.3) return 'rgba(34,197,94,0.85)';
+                    if (v >= 0) return 'rgba(96,165,250,0.85)';
+                    return 'rgba(239,68,68,0.85)';
+                }),
+                borderWidth: 0
+            }]
+        },
+        options: {
+            responsive: true,
+            plugins: { legend: { display: false } },
+            scales: { x: { ticks: { maxRotation: 0, autoSkip: true, maxTicksLimit: 10 } }, y: { min: -1, max: 1 } }
+        }
+    }),
+
+    distribution: (labels, values) => ({
+        type: 'pie',
+        data: {
+            labels: labels,
+            datasets: [{ data: values, backgroundColor: ['#10b981','#667eea','#f59e0b','#ef4444','#9CA3AF'] }]
+        },
+        options: { responsive: true, plugins: { legend: { position: 'bottom' } } }
+    }),
+
+    analytics: (labels, values) => ({
+        type: 'line',
+        data: {
+            labels: labels,
+            datasets: [{
+                label: 'Sentiment Score',
+                data: values,
+                borderColor: '#34d399',
+                backgroundColor: 'rgba(52, 211, 153, 0.2)',
+                fill: true,
+                tension: 0.3
+            }]
+        },
+        options: {
+            scales: {
+                y: { min: -1, max: 1, title: { display: true, text: 'Sentiment (-1 to +1)' } }
+            }
+        }
+    })
+};
+
+if (typeof Chart !== 'undefined') {
+    document.querySelectorAll('canvas[data-chart]').forEach(canvas => {
+        const build = moodCharts[canvas.dataset.chart];
+        if (build) {
+            new Chart(canvas.getContext('2d'), build(JSON.parse(canvas.dataset.labels), JSON.parse(canvas.dataset.values)));
+        }
+    });
+}
@@ -0,0 +1,50 @@
+import os
+import sys
+import tempfile
+
+import pytest
+
+# app.py reads DATABASE_URL and migrates at import, so point it at a scratch
+# database before the first test module imports it
+_tmp = tempfile.TemporaryDirectory()
+os.environ['DATABASE_URL'] = f"sqlite:///{os.path.join(_tmp.name, 'test.db')}"
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import app as feelup  # noqa: E402
+
+
+@pytest.fixture
+def db():
+    # Empty tables inside an app context for each test
+    with feelup.app.app_context():
+        for table in reversed(feelup.db.metadata.sorted_tables):
+            feelup.db.session.execute(table.delete())
+        feelup.db.session.commit()
+        yield feelup.db
+        feelup.db.session.rollback()
+
+
+@pytest.fixture
+def make_user(db):
+    def make(name, email=None):
+        user = feelup.User(name=name, email=email or f"{name.lower()}@example.com", password_hash='x')
+        db.session.add(user)
+        db.session.commit()
+        return user
+    return make
+
+
+@pytest.fixture
+def client(db):
+    return feelup.app.test_client()
+
+
+@pytest.fixture
+def login(client):
+    def log_in(user):
+        # Same session keys as /login: Flask-Login's and the app's own
+        with client.session_transaction() as sess:
+            sess['_user_id'] = str(user.id)
+            sess['user_id'] = user.id
+        return client
+    return log_in
@@ -0,0 +1,16 @@
+from datetime import datetime
+
+import app as feelup
+from app import Memory, MoodPost
+
+
+def test_check_indexes_passes_on_the_app_schema(db, make_user):
+    user = make_user('Ann')
+    db.session.add_all([MoodPost(user_id=user.id, content='hi', emotion='positive', created_at=datetime(2026, 1, 1)),
+                        Memory(user_id=user.id, title='t', body='b')])
+    db.session.commit()
+    result = feelup.app.test_cli_runner().invoke(args=['check-indexes'])
+    assert result.exit_code == 0, result.output
+    assert '❌' not in result.output
+    # Checks follow the real helpers, e.g. the feed page's eager-loaded comments
+    assert 'ix_comment_mood_id' in result.output
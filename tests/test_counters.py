@@ -0,0 +1,62 @@
+from datetime import datetime
+
+from sqlalchemy import event
+
+import app as feelup
+from app import MoodPost, MoodReaction, MoodStatBucket
+
+
+def make_post(db):
+    post = MoodPost(content='hello', emotion='positive')
+    db.session.add(post)
+    db.session.commit()
+    return post
+
+
+def test_increment_counter_inserts_then_increments(db):
+    post = make_post(db)
+    key = {'mood_id': post.id, 'emoji': '😊'}
+    feelup.increment_counter(MoodReaction, key, count=1)
+    feelup.increment_counter(MoodReaction, key, count=2)
+    db.session.commit()
+    assert MoodReaction.query.filter_by(**key).one().count == 3
+
+
+def test_increment_counter_survives_losing_the_first_insert_race(db):
+    # Another writer inserts the row between our UPDATE (which matched
+    # nothing) and our INSERT; the INSERT must fall back to the increment
+    post = make_post(db)
+    raced = []
+
+    @event.listens_for(db.engine, 'after_cursor_execute')
+    def competing_insert(conn, cursor, statement, parameters, context, executemany):
+        if not raced and statement.startswith('UPDATE mood_reaction') and cursor.rowcount == 0:
+            raced.append(True)
+            conn.exec_driver_sql("INSERT INTO mood_reaction (mood_id, emoji, count) VALUES (?, ?, 5)",
+                                 (post.id, '❤️'))
+    try:
+        feelup.increment_counter(MoodReaction, {'mood_id': post.id, 'emoji': '❤️'}, count=1)
+        db.session.commit()
+    finally:
+        event.remove(db.engine, 'after_cursor_execute', competing_insert)
+    assert raced
+    assert [r.count for r in MoodReaction.query.filter_by(mood_id=post.id)] == [6]
+
+
+def test_clamped_decrements_stop_at_zero(db):
+    key = {'hour': datetime(2026, 1, 1, 12), 'emotion': 'neutral'}
+    feelup.increment_counter(MoodStatBucket, key, clamp=True, count=-1)
+    db.session.commit()
+    assert MoodStatBucket.query.filter_by(**key).one().count == 0
+    feelup.increment_counter(MoodStatBucket, key, clamp=True, count=2)
+    feelup.increment_counter(MoodStatBucket, key, clamp=True, count=-5)
+    db.session.commit()
+    assert MoodStatBucket.query.filter_by(**key).one().count == 0
+
+
+def test_user_counters_never_go_negative(db, make_user):
+    user = make_user('Ann')
+    feelup.bump_user_counters(user.id, posts_count=-1)
+    db.session.commit()
+    db.session.refresh(user)
+    assert user.posts_count == 0
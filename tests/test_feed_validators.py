@@ -0,0 +1,34 @@
+import app as feelup
+from app import MoodPost
+
+
+def test_feed_etag_follows_reaction_counts(db, make_user, login):
+    client = login(make_user('Ann'))
+    post = MoodPost(content='hello', emotion='positive')
+    db.session.add(post)
+    db.session.commit()
+
+    first = client.get('/api/mood/feed')
+    etag = first.headers['ETag']
+    assert client.get('/api/mood/feed', headers={'If-None-Match': etag}).status_code == 304
+
+    # A reaction written by another worker (e.g. its ReactionBuffer flush)
+    # must invalidate the validator this worker hands out
+    feelup.increment_reaction(post.id, '🎉', 3)
+    db.session.commit()
+    fresh = client.get('/api/mood/feed', headers={'If-None-Match': etag})
+    assert fresh.status_code == 200
+    assert fresh.json['posts'][0]['reactions'] == {'🎉': 3}
+    assert fresh.headers['ETag'] != etag
+
+
+def test_feed_etag_follows_post_edits(db, make_user, login):
+    client = login(make_user('Ann'))
+    post = MoodPost(content='hello', emotion='positive')
+    db.session.add(post)
+    db.session.commit()
+    etag = client.get('/api/mood/feed').headers['ETag']
+
+    post.content = 'hello again'
+    db.session.commit()
+    assert client.get('/api/mood/feed', headers={'If-None-Match': etag}).status_code == 200
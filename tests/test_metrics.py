@@ -0,0 +1,14 @@
+import pytest
+
+import app as feelup
+
+
+@pytest.mark.parametrize('path', ['/metrics', '/api/stats/sentiment-cache'])
+def test_internal_stats_are_gated(client, monkeypatch, path):
+    monkeypatch.setitem(feelup.app.config, 'METRICS_ENABLED', False)
+    assert client.get(path).status_code == 404
+
+    monkeypatch.setitem(feelup.app.config, 'METRICS_ENABLED', True)
+    monkeypatch.setitem(feelup.app.config, 'METRICS_TOKEN', 's3cret')
+    assert client.get(path).status_code == 401
+    assert client.get(path, headers={'Authorization': 'Bearer s3cret'}).status_code == 200
@@ -0,0 +1,140 @@
+from datetime import date, datetime, timedelta
+
+import app as feelup
+from app import Message, MoodJournal, MoodPost
+
+T0 = datetime(2026, 1, 1, 12, 0, 0)
+
+
+def walk(fetch):
+    # Follow next cursors from the first page; returns the ids seen
+    ids, cursor = [], None
+    while True:
+        rows, cursor = fetch(cursor)
+        ids += [row.id for row in rows]
+        if not cursor:
+            return ids
+
+
+def test_feed_pages_cover_every_post_once_with_tied_timestamps(db):
+    # Three posts share each timestamp, so pages must break ties on id
+    posts = [MoodPost(content=f'p{i}', emotion='neutral', created_at=T0 - timedelta(minutes=i // 3)) for i in range(10)]
+    db.session.add_all(posts)
+    db.session.commit()
+    expected = [p.id for p in sorted(posts, key=lambda p: (p.created_at, p.id), reverse=True)]
+
+    def fetch(cursor):
+        rows, _, _, next_cursor = feelup.feed_page(cursor, limit=2)
+        return rows, next_cursor
+    assert walk(fetch) == expected
+
+
+def test_feed_ignores_malformed_cursor(db):
+    db.session.add(MoodPost(content='only', emotion='neutral', created_at=T0))
+    db.session.commit()
+    rows, _, _, next_cursor = feelup.feed_page('not-a-cursor')
+    assert [p.content for p in rows] == ['only']
+    assert next_cursor is None
+
+
+def test_journal_pages_older_then_back_to_newer(db, make_user):
+    user = make_user('Writer')
+    entries = [MoodJournal(user_id=user.id, date=date(2026, 1, 1 + i // 4), text=f'e{i}',
+                           created_at=T0 + timedelta(days=i // 4, seconds=i // 2)) for i in range(11)]
+    db.session.add_all(entries)
+    db.session.commit()
+    expected = [e.id for e in sorted(entries, key=lambda e: (e.date, e.created_at, e.id), reverse=True)]
+
+    pages, after = [], None
+    while True:
+        page, newer, older = feelup.journal_page(user.id, after=after, limit=3)
+        pages.append(page)
+        if not older:
+            break
+        after = older
+    assert [e.id for page in pages for e in page] == expected
+
+    # Walking back with the newer cursors returns the same pages in reverse
+    back = []
+    while newer:
+        page, newer, _ = feelup.journal_page(user.id, before=newer, limit=3)
+        back.insert(0, [e.id for e in page])
+    assert back == [[e.id for e in page] for page in pages[:-1]]
+
+
+def test_journal_first_page_has_no_newer_cursor(db, make_user):
+    user = make_user('Writer')
+    db.session.add(MoodJournal(user_id=user.id, date=date(2026, 1, 1), text='x', created_at=T0))
+    db.session.commit()
+    entries, newer, older = feelup.journal_page(user.id)
+    assert len(entries) == 1 and newer is None and older is None
+
+
+def test_chat_pages_merge_both_directions_in_order(db, make_user):
+    a, b, c = make_user('Ann'), make_user('Ben'), make_user('Cat')
+    msgs = []
+    for i in range(9):
+        sender, receiver = (a, b) if i % 3 else (b, a)
+        msgs.append(Message(sender_id=sender.id, receiver_id=receiver.id, text=f'm{i}',
+                            created_at=T0 + timedelta(seconds=i // 2)))
+    # Someone else's conversation must not leak in
+    msgs.append(Message(sender_id=a.id, receiver_id=c.id, text='other', created_at=T0))
+    db.session.add_all(msgs)
+    db.session.commit()
+    expected = [m.id for m in sorted(msgs[:9], key=lambda m: (m.created_at, m.id))]
+
+    seen, cursor = [], None
+    while True:
+        page, cursor = feelup.chat_page(a.id, b.id, cursor, limit=4)
+        seen = [m.id for m in page] + seen
+        assert [m.id for m in page] == sorted((m.id for m in page), key=expected.index)
+        if not cursor:
+            break
+    assert seen == expected
+
+
+def test_chat_with_yourself_lists_each_message_once(db, make_user):
+    a = make_user('Ann')
+    db.session.add_all([Message(sender_id=a.id, receiver_id=a.id, text=f'note {i}', created_at=T0) for i in range(3)])
+    db.session.commit()
+    page, cursor = feelup.chat_page(a.id, a.id)
+    assert len(page) == 3 and cursor is None
+
+
+NAMES = ['Ana', 'Bob', 'Zed', 'Zoë', 'Élodie', 'Émile', 'Ölaf']
+
+
+def test_directory_prefix_search_folds_non_ascii_case(db, make_user):
+    for name in NAMES:
+        make_user(name)
+    for q in ('É', 'é'):
+        users, _ = feelup.user_directory(q)
+        assert [u.name for u in users] == ['Élodie', 'Émile']
+    users, _ = feelup.user_directory('ö')
+    assert [u.name for u in users] == ['Ölaf']
+
+
+def test_directory_prefix_search_matches_email(db, make_user):
+    make_user('Someone', email='Zed.Mail@example.com')
+    users, _ = feelup.user_directory('zed.m')
+    assert [u.name for u in users] == ['Someone']
+
+
+def test_directory_pages_visit_every_user_once(db, make_user):
+    # 'Ana' and 'ana' tie on the sort key, so the cursor has to break ties on id
+    for i, name in enumerate(NAMES + ['ana']):
+        make_user(name, email=f'user{i}@example.com')
+
+    def fetch(cursor):
+        return feelup.user_directory(None, cursor, limit=2)
+    names = [feelup.db.session.get(feelup.User, uid).name for uid in walk(fetch)]
+    assert sorted(names) == sorted(NAMES + ['ana'])
+    assert [n.casefold() for n in names] == sorted(n.casefold() for n in names)
+
+
+def test_directory_tracks_renames(db, make_user):
+    user = make_user('Ana', email='someone@example.com')
+    user.name = 'Åsa'
+    db.session.commit()
+    assert [u.id for u in feelup.user_directory('å')[0]] == [user.id]
+    assert feelup.user_directory('ana')[0] == []
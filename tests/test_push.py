@@ -0,0 +1,53 @@
+import pytest
+
+import app as feelup
+from app import MoodPost
+
+
+@pytest.fixture
+def subscribe():
+    subs = []
+
+    def sub(channels):
+        s = feelup.push_hub.subscribe(channels)
+        subs.append(s)
+        return s
+    yield sub
+    for s in subs:
+        feelup.push_hub.unsubscribe(s)
+
+
+def drain(sub):
+    events = []
+    while not sub.queue.empty():
+        events.append(sub.queue.get_nowait())
+    return events
+
+
+def test_chat_streams_only_get_their_conversation(db, make_user, login, subscribe):
+    a, b, c = make_user('Ann'), make_user('Ben'), make_user('Cat')
+    ours = subscribe(feelup.stream_channels(b, ['chat:%d' % a.id]))
+    theirs = subscribe(feelup.stream_channels(c, ['chat:%d' % a.id]))
+    feed = subscribe(feelup.stream_channels(b, ['feed']))
+    post = MoodPost(content='hello', emotion='positive')
+    db.session.add(post)
+    db.session.commit()
+    client = login(a)
+
+    client.post(f'/messages/{b.id}', data={'text': 'hi Ben'})
+    client.post(f'/mood/{post.id}/react/🎉')
+
+    assert [(e['type'], e['receiver_id']) for e in drain(ours)] == [('message', b.id)]
+    assert drain(theirs) == []
+    assert [e['type'] for e in drain(feed)] == ['reaction']
+
+
+def test_stream_requires_known_channels(db, make_user, login):
+    client = login(make_user('Ann'))
+    assert client.get('/api/stream').status_code == 400
+    assert client.get('/api/stream?channels=user:1').status_code == 400
+    assert client.get('/api/stream?channels=feed,chat:x').status_code == 400
+
+
+def test_conversation_channel_is_the_same_from_both_sides():
+    assert feelup.conversation_channel(3, 7) == feelup.conversation_channel(7, 3) == 'chat:3:7'
@@ -0,0 +1,115 @@
+from datetime import date
+
+from sqlalchemy import inspect as sa_inspect
+
+import app as feelup
+from app import (Conversation, DailyMoodRollup, Event, EventJoin, Follow, Message, MoodEntry, MoodJournal,
+                 MoodPost, MoodStatBucket, User)
+
+
+def index_names(db, table):
+    return {name for (name,) in db.session.execute(
+        db.text("SELECT name FROM sqlite_master WHERE type='index' AND tbl_name=:t"), {'t': table})}
+
+
+def upgrade_after_dropping(db, *tables):
+    # Simulate a database from before these tables existed, then upgrade it
+    with db.engine.begin() as conn:
+        for table in tables:
+            conn.exec_driver_sql(f"DROP TABLE {table}")
+    db.session.expire_all()
+    created = feelup.upgrade_schema()
+    assert set(tables) <= created
+    feelup.run_schema_backfills(created)
+
+
+def test_upgrade_schema_is_idempotent(db):
+    # Expression and plain indexes alike must be recognized as present
+    assert feelup.upgrade_schema() == set()
+    before = index_names(db, 'user')
+    assert feelup.upgrade_schema() == set()
+    assert index_names(db, 'user') == before
+    assert {'ix_user_name_lower_id', 'ix_user_email_lower_id'} <= before
+
+
+def test_upgrade_schema_drops_stale_expression_indexes(db):
+    db.session.execute(db.text("CREATE INDEX ix_user_name_lower ON user (lower(name))"))
+    db.session.commit()
+    feelup.upgrade_schema()
+    assert 'ix_user_name_lower' not in index_names(db, 'user')
+
+
+def test_new_columns_and_tables_are_backfilled_once(db):
+    # Simulate a database from before the counters, search keys and mood buckets
+    db.session.add_all([User(name='Élodie', email='E@example.com', password_hash='x')])
+    db.session.commit()
+    uid = db.session.query(User.id).scalar()
+    db.session.add_all([MoodPost(user_id=uid, content='a', emotion='positive'),
+                        MoodPost(user_id=uid, content='b', emotion='positive')])
+    db.session.commit()
+    with db.engine.begin() as conn:
+        for column in ('posts_count', 'name_lower', 'email_lower'):
+            conn.exec_driver_sql(f"DROP INDEX IF EXISTS ix_user_{column.split('_')[0]}_lower_id")
+            conn.exec_driver_sql(f"ALTER TABLE user DROP COLUMN {column}")
+        conn.exec_driver_sql("DROP TABLE mood_stat_bucket")
+    db.session.expire_all()
+
+    created = feelup.upgrade_schema()
+    assert {'user.posts_count', 'user.name_lower', 'user.email_lower', 'mood_stat_bucket'} <= created
+    feelup.run_schema_backfills(created)
+
+    user = db.session.get(User, uid)
+    assert (user.posts_count, user.name_lower, user.email_lower) == (2, 'élodie', 'e@example.com')
+    assert sum(b.count for b in MoodStatBucket.query) == 2
+    assert 'posts_count' in {c['name'] for c in sa_inspect(db.engine).get_columns('user')}
+
+
+def test_new_conversation_table_is_filled_from_messages(db, make_user):
+    a, b = make_user('Ann'), make_user('Ben')
+    db.session.add_all([Message(sender_id=a.id, receiver_id=b.id, text='hi'),
+                        Message(sender_id=b.id, receiver_id=a.id, text='hello back')])
+    db.session.commit()
+    upgrade_after_dropping(db, 'conversation')
+    inbox = {(c.user_id, c.other_user_id): c.preview for c in Conversation.query}
+    assert inbox == {(a.id, b.id): 'hello back', (b.id, a.id): 'hello back'}
+
+
+def test_new_rollup_table_is_filled_from_scored_entries(db, make_user):
+    user = make_user('Ann')
+    db.session.add_all([MoodJournal(user_id=user.id, date=date(2026, 1, 1), text='a', emotion='positive', sentiment_score=0.5),
+                        MoodEntry(user_id=user.id, mood='happy', score=0.25),
+                        MoodEntry(user_id=user.id, mood='happy', note='later', score_pending=True)])
+    db.session.commit()
+    upgrade_after_dropping(db, 'daily_mood_rollup')
+    # The pending check-in is rolled up by the sentiment worker, not the backfill
+    assert sorted((r.source, r.count, r.score_sum) for r in DailyMoodRollup.query) == [('checkin', 1, 0.25), ('journal', 1, 0.5)]
+
+
+def test_new_attendee_count_column_is_counted(db):
+    event = Event(title='Picnic')
+    db.session.add(event)
+    db.session.commit()
+    db.session.add_all([EventJoin(event_id=event.id, name='Ann'), EventJoin(event_id=event.id, name='Ben')])
+    db.session.commit()
+    with db.engine.begin() as conn:
+        conn.exec_driver_sql("ALTER TABLE event DROP COLUMN attendee_count")
+    db.session.expire_all()
+    created = feelup.upgrade_schema()
+    assert 'event.attendee_count' in created
+    feelup.run_schema_backfills(created)
+    assert db.session.get(Event, event.id).attendee_count == 2
+
+
+def test_destructive_upgrade_steps_are_logged(db, make_user, caplog):
+    a, b = make_user('Ann'), make_user('Ben')
+    with db.engine.begin() as conn:
+        conn.exec_driver_sql("DROP INDEX uq_follow_pair")
+        conn.exec_driver_sql("CREATE INDEX ix_follow_stale ON follow (follower_id)")
+    db.session.add_all([Follow(follower_id=a.id, followed_id=b.id) for _ in range(3)])
+    db.session.commit()
+
+    feelup.upgrade_schema()
+    assert Follow.query.count() == 1
+    warnings = [r.getMessage() for r in caplog.records if r.levelname == 'WARNING']
+    assert 'upgrade_schema: dropping index ix_follow_stale on follow (no longer declared)' in warnings
+    assert 'upgrade_schema: deleted 2 duplicate follow rows before creating uq_follow_pair' in warnings
@@ -0,0 +1,32 @@
+import nltk
+import pytest
+
+import app as feelup
+
+
+def test_missing_lexicon_is_downloaded_on_first_use(monkeypatch):
+    monkeypatch.setattr(feelup, '_sia', None)
+    downloads = []
+    real_find = nltk.data.find
+
+    def find(resource, *args, **kwargs):
+        if not downloads:
+            raise LookupError(resource)
+        return real_find(resource, *args, **kwargs)
+    monkeypatch.setattr(nltk.data, 'find', find)
+    monkeypatch.setattr(nltk, 'download', lambda name, quiet=False: downloads.append(name) or True)
+
+    with feelup.app.app_context():
+        assert feelup.get_sentiment_analyzer().polarity_scores('good')['compound'] > 0
+    assert downloads == ['vader_lexicon']
+
+
+def test_failed_lexicon_download_names_the_cli_command(monkeypatch):
+    monkeypatch.setattr(feelup, '_sia', None)
+
+    def find(resource, *args, **kwargs):
+        raise LookupError(resource)
+    monkeypatch.setattr(nltk.data, 'find', find)
+    monkeypatch.setattr(nltk, 'download', lambda name, quiet=False: False)
+    with pytest.raises(LookupError, match='flask download-lexicon'):
+        feelup.get_sentiment_analyzer()
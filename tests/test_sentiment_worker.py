@@ -0,0 +1,89 @@
+import threading
+from datetime import date
+
+import pytest
+
+import app as feelup
+from app import DailyMoodRollup, MoodEntry, MoodJournal
+
+
+@pytest.fixture
+def worker():
+    return feelup.SentimentWorker(workers=1, batch_size=10)
+
+
+def rollups(user_id):
+    return [(r.source, r.count, r.score_count) for r in
+            DailyMoodRollup.query.filter_by(user_id=user_id).order_by(DailyMoodRollup.source)]
+
+
+def test_run_batch_scores_pending_rows_and_rolls_them_up_once(db, make_user, worker):
+    user = make_user('Ann')
+    db.session.add_all([
+        MoodJournal(user_id=user.id, date=date(2026, 1, 1), text='What a wonderful, happy day', score_pending=True),
+        MoodEntry(user_id=user.id, mood='happy', note='I love this', score_pending=True),
+    ])
+    db.session.commit()
+
+    assert worker.run_batch() == 2
+    journal, entry = MoodJournal.query.one(), MoodEntry.query.one()
+    assert journal.sentiment_score > 0 and journal.emotion == 'positive' and not journal.score_pending
+    assert entry.score > 0 and not entry.score_pending
+    assert rollups(user.id) == [('checkin', 1, 1), ('journal', 1, 1)]
+    # Nothing left to claim, so a second pass leaves the rollups alone
+    assert worker.run_batch() == 0
+    assert rollups(user.id) == [('checkin', 1, 1), ('journal', 1, 1)]
+
+
+def test_concurrent_batches_claim_each_row_once(db, make_user):
+    user = make_user('Ann')
+    db.session.add(MoodJournal(user_id=user.id, date=date(2026, 1, 1), text='fine', score_pending=True))
+    db.session.commit()
+
+    start = threading.Barrier(2)
+    scored = []
+
+    def dispatch():
+        with feelup.app.app_context():
+            start.wait()
+            scored.append(feelup.SentimentWorker(workers=1).run_batch())
+            feelup.db.session.remove()
+    threads = [threading.Thread(target=dispatch) for _ in range(2)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert sorted(scored) == [0, 1]
+    db.session.expire_all()
+    assert rollups(user.id) == [('journal', 1, 1)]
+
+
+@pytest.fixture
+def async_sentiment(monkeypatch):
+    # Requests must only save and queue; scoring in the request would fail
+    monkeypatch.setitem(feelup.app.config, 'SENTIMENT_ASYNC', True)
+    notified = []
+    monkeypatch.setattr(feelup.sentiment_worker, 'notify', lambda: notified.append(True))
+
+    def no_scoring(text):
+        raise AssertionError('scored during the request')
+    monkeypatch.setattr(feelup, 'analyze_mood', no_scoring)
+    return notified
+
+
+def test_async_journal_and_checkin_only_queue_the_text(db, make_user, login, async_sentiment, worker):
+    user = make_user('Ann')
+    client = login(user)
+
+    assert client.post('/journal', data={'text': 'A calm evening'}).status_code == 302
+    assert client.post('/checkin', data={'mood': 'calm', 'note': 'Quiet day'}).status_code == 302
+    assert async_sentiment == [True, True]
+
+    journal, entry = MoodJournal.query.one(), MoodEntry.query.one()
+    assert journal.score_pending and journal.sentiment_score is None
+    assert entry.score_pending and entry.score is None
+    # Pending rows reach the rollup only once the worker scores them
+    assert rollups(user.id) == []
+    assert worker.run_batch() == 2
+    assert rollups(user.id) == [('checkin', 1, 1), ('journal', 1, 1)]
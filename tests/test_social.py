@@ -0,0 +1,58 @@
+import app as feelup
+from app import Follow
+
+
+def follow(db, follower, *followed):
+    db.session.add_all([Follow(follower_id=follower.id, followed_id=f.id) for f in followed])
+    db.session.commit()
+
+
+def test_suggestions_rank_friends_of_friends_and_skip_existing_follows(db, make_user):
+    me, a, b, c, d, e = (make_user(n) for n in ('Me', 'A', 'B', 'C', 'D', 'E'))
+    follow(db, me, a, b)
+    follow(db, a, c, d, me, b)
+    follow(db, b, d)
+    graph = feelup.SocialGraph(ttl=60, sample_size=100)
+    # d is followed by both of my followees, c by one; then the newest sign-up
+    assert [u.name for u in graph.suggestions(me.id, limit=3)] == ['D', 'C', 'E']
+
+
+def test_suggestions_are_cached_until_a_follow(db, make_user):
+    me, a, b = make_user('Me'), make_user('A'), make_user('B')
+    graph = feelup.SocialGraph(ttl=60, sample_size=100)
+    assert [u.name for u in graph.suggestions(me.id)] == ['B', 'A']
+    follow(db, a, b)
+    assert [u.name for u in graph.suggestions(me.id)] == ['B', 'A']  # cached
+    graph.follow(me.id, b.id)
+    assert [u.name for u in graph.suggestions(me.id)] == ['A']
+
+
+def test_suggestions_sample_a_bounded_number_of_followees(db, make_user):
+    me, a, b, c = make_user('Me'), make_user('A'), make_user('B'), make_user('C')
+    follow(db, me, a, b)
+    follow(db, a, c)
+    follow(db, b, c)
+    graph = feelup.SocialGraph(ttl=60, sample_size=1)
+    queries = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        queries.append(statement)
+    feelup.event.listen(db.engine, 'before_cursor_execute', record)
+    try:
+        assert [u.name for u in graph.suggestions(me.id, limit=1)] == ['C']
+    finally:
+        feelup.event.remove(db.engine, 'before_cursor_execute', record)
+    # The friends-of-friends query binds one sampled followee, not both
+    assert any('follow.follower_id IN (?)' in q for q in queries)
+    assert not any('follow.follower_id IN (?, ?)' in q for q in queries)
+
+
+
+def test_follow_counts_never_go_negative(db, make_user):
+    a, b = make_user('A'), make_user('B')
+    graph = feelup.SocialGraph(ttl=60, sample_size=100)
+    graph._adjust_counts(a.id, b.id, -1)
+    db.session.commit()
+    db.session.refresh(a)
+    db.session.refresh(b)
+    assert (a.following_count, b.followers_count) == (0, 0)
@@ -0,0 +1,24 @@
+import pytest
+
+import app as feelup
+
+
+@pytest.fixture
+def built_static(tmp_path, monkeypatch):
+    # Fingerprint a scratch static folder instead of the repo's
+    (tmp_path / 'main.js').write_text('console.log("hi");\n' * 50)
+    monkeypatch.setattr(feelup.app, 'static_folder', str(tmp_path))
+    monkeypatch.setattr(feelup, 'static_manifest', {})
+    result = feelup.app.test_cli_runner().invoke(args=['build-static'])
+    assert result.exit_code == 0, result.output
+    return feelup.static_manifest
+
+
+def test_fingerprinted_assets_are_immutable_but_the_manifest_is_not(client, built_static):
+    asset = client.get(f"/static/dist/{built_static['main.js']}")
+    assert asset.status_code == 200
+    assert 'immutable' in asset.headers['Cache-Control']
+
+    manifest = client.get('/static/dist/manifest.json')
+    assert manifest.status_code == 200
+    assert manifest.headers['Cache-Control'] == 'no-cache'